@@ -1,16 +1,21 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
+import {Test} from "forge-std/Test.sol";
 import {DeGymToken} from "../src/token/DGYM.sol";
 
 contract TokenTest is Test {
     DeGymToken token;
     address owner = address(0x123);
-    uint256 user1PrivateKey = 0xA11CE; // Example private key (replace with your own key)
-    address user1 = vm.addr(user1PrivateKey);
+    uint256 constant USER1_PRIVATE_KEY = 0xA11CE; // Example private key (replace with your own key)
+    address user1 = vm.addr(USER1_PRIVATE_KEY);
     address user2 = address(0x789);
 
+    bytes32 constant PERMIT_TYPEHASH =
+        keccak256(
+            "Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+        );
+
     function setUp() public {
         token = new DeGymToken(owner);
     }
@@ -89,9 +94,7 @@ contract TokenTest is Test {
         // Create the permit hash as defined by EIP-2612
         bytes32 structHash = keccak256(
             abi.encode(
-                keccak256(
-                    "Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
-                ),
+                PERMIT_TYPEHASH,
                 user1,
                 user2,
                 amount,
@@ -105,7 +108,7 @@ contract TokenTest is Test {
         );
 
         // Sign the permit digest with user1's private key
-        (uint8 v, bytes32 r, bytes32 s) = vm.sign(user1PrivateKey, digest);
+        (uint8 v, bytes32 r, bytes32 s) = vm.sign(USER1_PRIVATE_KEY, digest);
 
         // Perform the permit
         vm.prank(user1);
@@ -1,7 +1,7 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
+import {Test} from "forge-std/Test.sol";
 import {DeGymGovernor, IGovernor} from "../src/Governor.sol";
 import {DeGymToken} from "../src/token/DGYM.sol";
 import {TimelockController} from "@openzeppelin/contracts/governance/TimelockController.sol";
@@ -24,8 +24,6 @@ contract GovernorTest is Test {
         vm.startPrank(deployer);
 
         token = new DeGymToken(deployer);
-        token.grantRole(token.DEFAULT_ADMIN_ROLE(), deployer);
-        token.grantRole(token.MINTER_ROLE(), deployer);
 
         address[] memory proposers = new address[](1);
         proposers[0] = deployer;
@@ -40,9 +38,8 @@ contract GovernorTest is Test {
         );
 
         token.mint(deployer, 51_000_000e18);
-        token.mint(voter1, 850_000_000e18);
+        token.mint(voter1, 851_000_000e18);
         token.mint(voter2, 51_000_000e18);
-        token.mint(voter1, 1_000_000e18); // Mint 1 million tokens to voter1
 
         vm.warp(block.timestamp + 1);
         governor = new DeGymGovernor(token, timelock);
@@ -80,11 +77,14 @@ contract GovernorTest is Test {
             15_000_000_000e18
         );
 
+        string memory description = "Proposal: Change token cap to 15 billion";
+        bytes32 descriptionHash = keccak256(bytes(description));
+
         uint256 proposalId = governor.propose(
             targets,
             values,
             calldatas,
-            "Proposal: Change token cap to 15 billion"
+            description
         );
 
         vm.warp(block.timestamp + governor.votingDelay() + 1);
@@ -92,12 +92,7 @@ contract GovernorTest is Test {
 
         vm.warp(block.timestamp + governor.votingPeriod() + 1);
 
-        governor.queue(
-            targets,
-            values,
-            calldatas,
-            keccak256(bytes("Proposal: Change token cap to 15 billion"))
-        );
+        governor.queue(targets, values, calldatas, descriptionHash);
 
         assertEq(
             uint(governor.state(proposalId)),
@@ -106,12 +101,7 @@ contract GovernorTest is Test {
 
         vm.warp(block.timestamp + timelock.getMinDelay() + 1);
 
-        governor.execute(
-            targets,
-            values,
-            calldatas,
-            keccak256(bytes("Proposal: Change token cap to 15 billion"))
-        );
+        governor.execute(targets, values, calldatas, descriptionHash);
 
         assertEq(
             uint(governor.state(proposalId)),
@@ -123,27 +113,25 @@ contract GovernorTest is Test {
     }
 
     function testUpdateDecayConstant() public {
-        vm.startPrank(address(timelock));
         uint256 newDecayConstant = 50;
+        vm.prank(address(timelock));
         stakeManager.setDecayConstant(newDecayConstant);
         assertEq(
             stakeManager.decayConstant(),
             newDecayConstant,
             "Decay constant should be updated"
         );
-        vm.stopPrank();
     }
 
     function testUpdateBasisPoints() public {
-        vm.startPrank(address(timelock));
         uint256 newBasisPoints = 12000;
+        vm.prank(address(timelock));
         stakeManager.setBasisPoints(newBasisPoints);
         assertEq(
             stakeManager.basisPoints(),
             newBasisPoints,
             "Basis points should be updated"
         );
-        vm.stopPrank();
     }
 
     function testBondAfterParameterUpdate() public {
@@ -1,47 +1,24 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import {StakeManager} from "../src/staking/StakeManager.sol";
+import {console} from "forge-std/console.sol";
 import {BondPool} from "../src/staking/BondPool.sol";
-import {DeGymToken} from "../src/token/DGYM.sol";
 import {IAccessControl} from "@openzeppelin/contracts/access/IAccessControl.sol";
+import {StakingBaseTest} from "./utils/StakingBaseTest.sol";
 
-contract StakingTest is Test {
-    StakeManager public stakeManager;
-    DeGymToken public token;
-    uint256 private alicePrivateKey = 0xa11ce;
-    uint256 private bobPrivateKey = 0xb0b;
-    address public alice = vm.addr(alicePrivateKey);
-    address public bob = vm.addr(bobPrivateKey);
-    address public owner = address(0x3);
-    BondPool public aliceBondPool;
+contract StakingTest is StakingBaseTest {
+    uint256 private constant BOB_PRIVATE_KEY = 0xb0b;
+    uint256 private constant REWARD_ACCRUAL_PERIOD = 15 days;
+    address public bob = vm.addr(BOB_PRIVATE_KEY);
     BondPool public bobBondPool;
 
-    function setUp() public {
-        vm.startPrank(owner);
-        token = new DeGymToken(owner);
-        stakeManager = new StakeManager(address(token), owner);
-        token.grantRole(token.MINTER_ROLE(), address(stakeManager));
+    function setUp() public override {
+        super.setUp();
 
-        token.mint(alice, 1_000_000_000 * 10 ** 18);
+        vm.prank(owner);
         token.mint(bob, 10000 * 10 ** 18);
 
-        vm.stopPrank();
-
-        vm.startPrank(alice);
-        token.approve(address(stakeManager), type(uint256).max);
-        stakeManager.deployBondPool();
-        aliceBondPool = BondPool(stakeManager.bondPools(alice));
-        token.approve(address(aliceBondPool), type(uint256).max);
-        vm.stopPrank();
-
-        vm.startPrank(bob);
-        token.approve(address(stakeManager), type(uint256).max);
-        stakeManager.deployBondPool();
-        bobBondPool = BondPool(stakeManager.bondPools(bob));
-        token.approve(address(bobBondPool), type(uint256).max);
-        vm.stopPrank();
+        bobBondPool = deployBondPool(bob);
     }
 
     function testDeployBondPool() public view {
@@ -54,13 +31,8 @@ contract StakingTest is Test {
     }
 
     function testGetTotalBondWeight() public {
-        vm.startPrank(alice);
-        aliceBondPool.bond(1000 * 10 ** 18, 30 days);
-        vm.stopPrank();
-
-        vm.startPrank(bob);
-        bobBondPool.bond(500 * 10 ** 18, 60 days);
-        vm.stopPrank();
+        bondAs(alice, aliceBondPool, BOND_AMOUNT, LOCK_DURATION);
+        bondAs(bob, bobBondPool, 500 * 10 ** 18, 60 days);
 
         assertGt(stakeManager.getTotalBondWeight(), 0);
     }
@@ -68,64 +40,43 @@ contract StakingTest is Test {
     function testNotifyStakeChange() public {
         uint256 initialStake = stakeManager.totalStaked();
 
-        vm.prank(alice);
-        aliceBondPool.bond(1000 * 10 ** 18, 30 days);
+        bondAs(alice, aliceBondPool, BOND_AMOUNT, LOCK_DURATION);
 
-        assertEq(stakeManager.totalStaked(), initialStake + 1000 * 10 ** 18);
+        assertEq(stakeManager.totalStaked(), initialStake + BOND_AMOUNT);
     }
 
     function testNotifyWeightChange() public {
         uint256 initialWeight = stakeManager.totalBondWeight();
 
-        vm.prank(alice);
-        aliceBondPool.bond(1000 * 10 ** 18, 30 days);
+        bondAs(alice, aliceBondPool, BOND_AMOUNT, LOCK_DURATION);
 
         assertGt(stakeManager.totalBondWeight(), initialWeight);
     }
 
     function testOnlyBondPoolCanCallRestrictedFunctions() public {
-        vm.expectRevert(
-            abi.encodeWithSelector(
-                IAccessControl.AccessControlUnauthorizedAccount.selector,
-                address(this),
-                stakeManager.BOND_POOL_ROLE()
-            )
+        bytes memory unauthorized = abi.encodeWithSelector(
+            IAccessControl.AccessControlUnauthorizedAccount.selector,
+            address(this),
+            stakeManager.BOND_POOL_ROLE()
         );
+
+        vm.expectRevert(unauthorized);
         stakeManager.notifyWeightChange(1000);
 
-        vm.expectRevert(
-            abi.encodeWithSelector(
-                IAccessControl.AccessControlUnauthorizedAccount.selector,
-                address(this),
-                stakeManager.BOND_POOL_ROLE()
-            )
-        );
+        vm.expectRevert(unauthorized);
         stakeManager.notifyStakeChange(1000, true);
 
-        vm.expectRevert(
-            abi.encodeWithSelector(
-                IAccessControl.AccessControlUnauthorizedAccount.selector,
-                address(this),
-                stakeManager.BOND_POOL_ROLE()
-            )
-        );
+        vm.expectRevert(unauthorized);
         stakeManager.claimReward(alice, 1000);
 
-        vm.expectRevert(
-            abi.encodeWithSelector(
-                IAccessControl.AccessControlUnauthorizedAccount.selector,
-                address(this),
-                stakeManager.BOND_POOL_ROLE()
-            )
-        );
+        vm.expectRevert(unauthorized);
         stakeManager.transferToUser(alice, 1000);
     }
 
     function testUpdateRewards() public {
-        vm.prank(alice);
-        aliceBondPool.bond(1000 * 10 ** 18, 30 days);
+        bondAs(alice, aliceBondPool, BOND_AMOUNT, LOCK_DURATION);
 
-        vm.warp(block.timestamp + 15 days);
+        vm.warp(block.timestamp + REWARD_ACCRUAL_PERIOD);
 
         stakeManager.updateRewards();
 
@@ -133,12 +84,10 @@ contract StakingTest is Test {
     }
 
     function testClaimReward() public {
-        vm.startPrank(alice);
-        aliceBondPool.bond(1000 * 10 ** 18, 30 days);
-        vm.stopPrank();
+        bondAs(alice, aliceBondPool, BOND_AMOUNT, LOCK_DURATION);
 
         // Simulate time passing and update rewards
-        vm.warp(block.timestamp + 15 days);
+        vm.warp(block.timestamp + REWARD_ACCRUAL_PERIOD);
         stakeManager.updateRewards();
 
         uint256 totalUnclaimedRewards = stakeManager.totalUnclaimedRewards();
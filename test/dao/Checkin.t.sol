@@ -2,51 +2,21 @@
 pragma solidity ^0.8.20;
 
 import {BaseTest} from "../utils/BaseTest.sol";
-import {Checkin} from "../../src/dao/Checkin.sol";
 
 /**
  * @title CheckinTest
  * @dev Test suite for the Checkin contract
  */
 contract CheckinTest is BaseTest {
-    Checkin public checkin;
-
     uint256 public gymId;
     uint256 public voucherId;
 
-    // Handle errors for functions that might not exist in contracts
-    bool voucherHasValidateFunction = true;
-    bool voucherHasDCPFunction = true;
-    bool voucherHasDailyDCPFunction = true;
-
     function setUp() public override {
         super.setUp();
 
-        // Deploy Checkin contract
-        checkin = new Checkin(address(voucherNFT), address(gymNFT));
-
-        // Mint a gym for testing
-        gymId = gymNFT.mintGymNFT(gymOwner, 1);
-
-        // Add tokens to the gym
-        vm.startPrank(gymOwner);
-        gymNFT.addAcceptedToken(gymId, address(testToken));
-        vm.stopPrank();
-
-        // Mint a voucher for testing
-        vm.startPrank(user1);
-        voucherId = voucherNFT.mint(1, 30, 0, address(testToken));
-        vm.stopPrank();
-
-        // Reset expectations
-        voucherHasValidateFunction = true;
-        voucherHasDCPFunction = true;
-        voucherHasDailyDCPFunction = true;
-
-        // Configure o contrato Checkin no GymNFT
-        vm.startPrank(owner);
-        gymNFT.setCheckinContract(address(checkin));
-        vm.stopPrank();
+        // Mint a gym and a voucher for testing
+        gymId = createGym(gymOwner, 1);
+        voucherId = mintVoucher(user1, 1, 30, 0);
     }
 
     function testCheckin() public {
@@ -64,14 +34,7 @@ contract CheckinTest is BaseTest {
 
     function testCheckinTimeConstraint() public {
         // Mint a high tier voucher para ter DCP suficiente para múltiplos check-ins
-        vm.startPrank(user1);
-        uint256 highTierVoucherId = voucherNFT.mint(
-            3,
-            30,
-            0,
-            address(testToken)
-        );
-        vm.stopPrank();
+        uint256 highTierVoucherId = mintVoucher(user1, 3, 30, 0);
 
         vm.startPrank(user1);
 
@@ -113,9 +76,8 @@ contract CheckinTest is BaseTest {
 
         // Reset DCP for the new day (usando a nova função de timezone=0)
         vm.stopPrank();
-        vm.startPrank(owner);
+        vm.prank(owner);
         voucherNFT.resetAllVouchersDCP(0); // Reset timezone 0
-        vm.stopPrank();
         vm.startPrank(user1);
 
         // DCP should be reset
@@ -130,36 +92,14 @@ contract CheckinTest is BaseTest {
     }
 
     function testInsufficientDCP() public {
-        vm.startPrank(user1);
-
-        // Create a low tier voucher
-        uint256 lowTierVoucherId = voucherNFT.mint(
-            1,
-            30,
-            0,
-            address(testToken)
-        );
-
-        // Create a high tier gym
-        vm.stopPrank();
-        uint256 highTierGymId = gymNFT.mintGymNFT(gymOwner, 5);
-        vm.startPrank(gymOwner);
-        // Add token acceptance for the gym
-        gymNFT.addAcceptedToken(highTierGymId, address(testToken));
-        vm.stopPrank();
-
-        vm.startPrank(user1);
+        // Create a low tier voucher and a high tier gym
+        uint256 lowTierVoucherId = mintVoucher(user1, 1, 30, 0);
+        uint256 highTierGymId = createGym(gymOwner, 5);
 
         // Try to check-in with a low tier voucher to a high tier gym
         // This should fail due to insufficient DCP
+        vm.prank(user1);
         vm.expectRevert("Insufficient DCP for this gym");
         checkin.checkin(lowTierVoucherId, highTierGymId);
-
-        vm.stopPrank();
-    }
-
-    // Utility function to emit logs
-    function logError(string memory message) internal {
-        emit log(message);
     }
 }
@@ -1,19 +1,12 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.17;
 
-import "forge-std/Test.sol";
-import "../../src/gym/GymManager.sol";
-import "../../src/gym/GymNFT.sol";
-import "../../src/treasury/Treasury.sol";
-import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
-import "../mocks/MockStakeManager.sol";
-
-// Mock token for testing
-contract MockToken is ERC20 {
-    constructor() ERC20("Mock Token", "MOCK") {
-        _mint(msg.sender, 1000000 * 10 ** 18);
-    }
-}
+import {Test} from "forge-std/Test.sol";
+import {GymManager} from "../../src/gym/GymManager.sol";
+import {GymNFT} from "../../src/gym/GymNFT.sol";
+import {Treasury} from "../../src/treasury/Treasury.sol";
+import {MockToken} from "../mocks/MockToken.sol";
+import {MockStakeManager} from "../mocks/MockStakeManager.sol";
 
 contract GymManagerTest is Test {
     // Contracts
@@ -28,11 +21,16 @@ contract GymManagerTest is Test {
     address public gymOwner = address(0x456);
     address public user = address(0x789);
 
+    // Test coordinates (NYC)
+    uint256 constant NYC_LAT = 40000000;
+    uint256 constant NYC_LNG = 74000000;
+
     function setUp() public {
         vm.startPrank(owner);
 
         // Deploy contracts
-        USDT = new MockToken();
+        USDT = new MockToken("Tether", "USDT", 18);
+        USDT.mint(owner, 1000000 * 10 ** 18);
         treasury = new Treasury();
         gymNFT = new GymNFT(address(treasury));
         stakeManager = new MockStakeManager();
@@ -60,14 +58,15 @@ contract GymManagerTest is Test {
         USDT.transfer(gymOwner, 10000 * 10 ** 18);
 
         vm.stopPrank();
+
+        // Approve the treasury once for every test
+        vm.prank(gymOwner);
+        USDT.approve(address(treasury), type(uint256).max);
     }
 
     function testRegisterGym() public {
-        vm.startPrank(gymOwner);
-
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
-        uint256[2] memory location = [uint256(40000000), uint256(74000000)]; // NYC coords
+        uint256[2] memory location = [NYC_LAT, NYC_LNG];
+        vm.prank(gymOwner);
         uint256 gymId = gymManager.registerGym("Test Gym", location, 5);
 
         assertGt(gymId, 0, "Gym ID should be greater than 0");
@@ -76,19 +75,16 @@ contract GymManagerTest is Test {
             gymOwner,
             "Gym owner should be set correctly"
         );
-
-        vm.stopPrank();
     }
 
     function testUpdateGymInfo() public {
         vm.startPrank(gymOwner);
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
 
-        uint256[2] memory location = [uint256(40000000), uint256(74000000)];
+        uint256[2] memory location = [NYC_LAT, NYC_LNG];
         uint256 gymId = gymManager.registerGym("Test Gym", location, 5);
 
         // Now update gym info
-        uint256[2] memory newLocation = [uint256(40000100), uint256(74000100)];
+        uint256[2] memory newLocation = [NYC_LAT + 100, NYC_LNG + 100];
         gymManager.updateGymInfo(
             gymId,
             "NYC Premium Fitness",
@@ -101,33 +97,27 @@ contract GymManagerTest is Test {
 
     function testNonOwnerCannotUpdateGym() public {
         // First register a gym
-        vm.startPrank(gymOwner);
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
-        uint256[2] memory location = [uint256(40000000), uint256(74000000)];
+        uint256[2] memory location = [NYC_LAT, NYC_LNG];
+        vm.prank(gymOwner);
         uint256 gymId = gymManager.registerGym("Test Gym", location, 5);
-        vm.stopPrank();
 
         // Try to update as non-owner
-        vm.startPrank(user);
-        uint256[2] memory newLocation = [uint256(40000100), uint256(74000100)];
+        uint256[2] memory newLocation = [NYC_LAT + 100, NYC_LNG + 100];
 
-        vm.expectRevert();
+        vm.prank(user);
+        vm.expectRevert("Not the gym owner");
         gymManager.updateGymInfo(
             gymId,
             "Hacked Name",
             newLocation,
             "Hacked details"
         );
-
-        vm.stopPrank();
     }
 
     function testTierUpgrade() public {
         vm.startPrank(gymOwner);
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
 
-        uint256[2] memory location = [uint256(40000000), uint256(74000000)];
+        uint256[2] memory location = [NYC_LAT, NYC_LNG];
         uint256 gymId = gymManager.registerGym("Test Gym", location, 5);
 
         // Tier should be 5
@@ -143,12 +133,9 @@ contract GymManagerTest is Test {
     }
 
     function testValidateGym() public {
-        vm.startPrank(gymOwner);
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
-        uint256[2] memory location = [uint256(40000000), uint256(74000000)];
+        uint256[2] memory location = [NYC_LAT, NYC_LNG];
+        vm.prank(gymOwner);
         uint256 gymId = gymManager.registerGym("Test Gym", location, 5);
-        vm.stopPrank();
 
         // Validate gym
         bool isValid = gymManager.validateGym(gymId);
@@ -1,13 +1,12 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import "../../src/gym/GymManager.sol";
-import "../../src/gym/GymNFT.sol";
-import "../../src/treasury/Treasury.sol";
-import "../../src/stake/StakeManager.sol";
-import "../../src/stake/IStakeManager.sol";
-import "../mocks/MockToken.sol";
+import {Test} from "forge-std/Test.sol";
+import {GymManager} from "../../src/gym/GymManager.sol";
+import {GymNFT} from "../../src/gym/GymNFT.sol";
+import {Treasury} from "../../src/treasury/Treasury.sol";
+import {StakeManager} from "../../src/stake/StakeManager.sol";
+import {MockToken} from "../mocks/MockToken.sol";
 
 contract GymManagerStakeIntegrationTest is Test {
     GymManager public gymManager;
@@ -1,7 +1,7 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "../../src/stake/IStakeManager.sol";
+import {IStakeManager} from "../../src/stake/IStakeManager.sol";
 
 /**
  * @title MockStakeManager
@@ -1,16 +1,10 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import "../../src/treasury/Treasury.sol";
-import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
-
-// Mock token for testing
-contract MockToken is ERC20 {
-    constructor() ERC20("Mock Token", "MOCK") {
-        _mint(msg.sender, 1000000 * 10 ** 18);
-    }
-}
+import {Test} from "forge-std/Test.sol";
+import {console} from "forge-std/console.sol";
+import {Treasury} from "../../src/treasury/Treasury.sol";
+import {MockToken} from "../mocks/MockToken.sol";
 
 contract TreasuryTest is Test {
     // Contracts
@@ -32,8 +26,10 @@ contract TreasuryTest is Test {
         vm.startPrank(owner);
 
         // Deploy contracts
-        mockToken = new MockToken();
-        secondToken = new MockToken();
+        mockToken = new MockToken("Mock Token", "MOCK", 18);
+        secondToken = new MockToken("Second Token", "SEC", 18);
+        mockToken.mint(owner, 1000000 * 10 ** 18);
+        secondToken.mint(owner, 1000000 * 10 ** 18);
         treasury = new Treasury();
 
         // Transfer tokens to user
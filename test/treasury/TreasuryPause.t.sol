@@ -1,11 +1,9 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import "../../src/treasury/Treasury.sol";
-import "../../src/gym/GymNFT.sol";
-import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
-import "../mocks/MockToken.sol";
+import {Test} from "forge-std/Test.sol";
+import {Treasury} from "../../src/treasury/Treasury.sol";
+import {MockToken} from "../mocks/MockToken.sol";
 
 contract TreasuryPauseTest is Test {
     Treasury public treasury;
@@ -1,23 +1,24 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import "forge-std/console.sol";
-import "../../src/user/VoucherNFT.sol";
-import "../../src/gym/GymNFT.sol";
-import "../../src/gym/GymManager.sol";
-import "../../src/treasury/Treasury.sol";
-import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
-import "../mocks/MockStakeManager.sol";
-
-// Mock token for testing
-contract MockToken is ERC20 {
-    constructor() ERC20("Mock Token", "MOCK") {
-        _mint(msg.sender, 1000000 * 10 ** 18);
-    }
-}
+import {Test} from "forge-std/Test.sol";
+import {VoucherNFT} from "../../src/user/VoucherNFT.sol";
+import {GymNFT} from "../../src/gym/GymNFT.sol";
+import {GymManager} from "../../src/gym/GymManager.sol";
+import {Treasury} from "../../src/treasury/Treasury.sol";
+import {MockToken} from "../mocks/MockToken.sol";
+import {MockStakeManager} from "../mocks/MockStakeManager.sol";
 
 contract VoucherNFTTest is Test {
+    event VoucherCreated(
+        uint256 indexed tokenId,
+        address indexed owner,
+        uint8 tier,
+        uint16 duration,
+        int8 timezone,
+        address paymentToken
+    );
+
     // Contratos
     VoucherNFT public voucherNFT;
     GymNFT public gymNFT;
@@ -35,12 +36,14 @@ contract VoucherNFTTest is Test {
     uint256 constant BASE_PRICE = 10 * 10 ** 18;
     uint256 constant MIN_FACTOR = 50; // 50%
     uint256 constant DECAY_RATE = 5; // 5%
+    uint256 constant JAN_1_2023 = 1672531200; // 1 de janeiro de 2023
 
     function setUp() public {
         vm.startPrank(owner);
 
         // Deploy contracts
-        USDT = new MockToken();
+        USDT = new MockToken("Tether", "USDT", 18);
+        USDT.mint(owner, 1000000 * 10 ** 18);
         treasury = new Treasury();
         gymNFT = new GymNFT(address(treasury));
         stakeManager = new MockStakeManager();
@@ -74,24 +77,38 @@ contract VoucherNFTTest is Test {
         USDT.transfer(user, 10000 * 10 ** 18);
 
         vm.stopPrank();
-    }
 
-    function testMintVoucher() public {
-        vm.startPrank(user);
+        // Approve the treasury once for every test
+        vm.prank(user);
+        USDT.approve(address(treasury), type(uint256).max);
+    }
 
-        // Approve treasury to spend tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
+    // Helper to mint a USDT-priced voucher as the test user
+    function mintVoucher(
+        uint8 tier,
+        uint256 duration,
+        int8 timezone
+    ) internal returns (uint256) {
+        vm.prank(user);
+        return voucherNFT.mint(tier, duration, timezone, address(USDT));
+    }
 
+    function testMintVoucher() public {
         // Mint a voucher - note the uint8 type for tier
         uint8 tier = 1;
         uint256 duration = 30; // 30 days
         int8 timezone = 0; // UTC
-        uint256 voucherId = voucherNFT.mint(
+
+        vm.expectEmit(true, true, false, true, address(voucherNFT));
+        emit VoucherCreated(
+            1,
+            user,
             tier,
-            duration,
+            uint16(duration),
             timezone,
             address(USDT)
         );
+        uint256 voucherId = mintVoucher(tier, duration, timezone);
 
         // Check voucher ownership
         assertEq(
@@ -99,30 +116,18 @@ contract VoucherNFTTest is Test {
             user,
             "User should own the voucher"
         );
-
-        vm.stopPrank();
     }
 
     function testVoucherAttributes() public {
         // Definir um timestamp razoável
-        vm.warp(1672531200); // 1 de janeiro de 2023
-
-        vm.startPrank(user);
-
-        // Approve treasury to spend tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
+        vm.warp(JAN_1_2023);
 
         // Mint a voucher com valores mais seguros
         uint8 tier = 1; // Reduzir de 2 para 1
         uint256 duration = 30; // Reduzir de 90 para 30 dias
         int8 timezone = 0; // Usar UTC em vez de UTC+2
 
-        uint256 voucherId = voucherNFT.mint(
-            tier,
-            duration,
-            timezone,
-            address(USDT)
-        );
+        uint256 voucherId = mintVoucher(tier, duration, timezone);
 
         // Verificações simplificadas
         assertTrue(voucherNFT.ownerOf(voucherId) == user);
@@ -135,26 +140,14 @@ contract VoucherNFTTest is Test {
             expiryDate > block.timestamp,
             "Voucher should expire in the future"
         );
-
-        vm.stopPrank();
     }
 
     function testDCPCalculation() public {
-        vm.startPrank(user);
-
-        // Approve treasury to spend tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
         // Mint a voucher with tier 3
         uint8 tier = 3;
         uint256 duration = 30; // 30 days
         int8 timezone = 0; // UTC
-        uint256 voucherId = voucherNFT.mint(
-            tier,
-            duration,
-            timezone,
-            address(USDT)
-        );
+        uint256 voucherId = mintVoucher(tier, duration, timezone);
 
         // Check DCP balance (should be daily allowance for tier 3)
         uint256 dcpBalance = voucherNFT.getDCPBalance(voucherId);
@@ -164,26 +157,14 @@ contract VoucherNFTTest is Test {
             expectedDCP,
             "Initial DCP balance should match tier calculation"
         );
-
-        vm.stopPrank();
     }
 
     function testExpiredVoucher() public {
-        vm.startPrank(user);
-
-        // Approve treasury to spend tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
         // Mint a short-lived voucher
         uint8 tier = 1;
         uint256 duration = 1; // 1 day
         int8 timezone = 0; // UTC
-        uint256 voucherId = voucherNFT.mint(
-            tier,
-            duration,
-            timezone,
-            address(USDT)
-        );
+        uint256 voucherId = mintVoucher(tier, duration, timezone);
 
         // Check that it's valid initially
         bool valid = voucherNFT.validateVoucher(voucherId);
@@ -195,14 +176,13 @@ contract VoucherNFTTest is Test {
         // Check that it's now invalid
         valid = voucherNFT.validateVoucher(voucherId);
         assertFalse(valid, "Voucher should be invalid after expiry");
-
-        vm.stopPrank();
     }
 
     function testMultiTokenPricing() public {
         // Add another token
         vm.startPrank(owner);
-        MockToken anotherToken = new MockToken();
+        MockToken anotherToken = new MockToken("Another Token", "ANT", 18);
+        anotherToken.mint(owner, 1000000 * 10 ** 18);
         treasury.addAcceptedToken(address(anotherToken));
 
         // Set different price parameters for new token
@@ -219,8 +199,7 @@ contract VoucherNFTTest is Test {
 
         vm.startPrank(user);
 
-        // Approve both tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
+        // Approve the second token
         anotherToken.approve(address(treasury), 1000 * 10 ** 18);
 
         // Mint vouchers with different tokens
@@ -271,13 +250,10 @@ contract VoucherNFTTest is Test {
     // Adicionamos um teste específico para timezones
     function testVoucherWithDifferentTimezones() public {
         // Definir um timestamp razoável
-        vm.warp(1672531200); // 1 de janeiro de 2023
+        vm.warp(JAN_1_2023);
 
         vm.startPrank(user);
 
-        // Approve treasury to spend tokens
-        USDT.approve(address(treasury), 1000 * 10 ** 18);
-
         // Array de timezones para testar (-12 a +14 é o intervalo válido)
         int8[5] memory timezonesToTest = [
             int8(-12),
@@ -1,14 +1,14 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.20;
 
-import "forge-std/Test.sol";
-import "../../src/user/VoucherNFT.sol";
-import "../../src/treasury/Treasury.sol";
-import "../mocks/MockToken.sol";
+import {Test} from "forge-std/Test.sol";
+import {console} from "forge-std/console.sol";
+import {VoucherNFT} from "../../src/user/VoucherNFT.sol";
+import {ITreasury} from "../../src/treasury/ITreasury.sol";
+import {MockToken} from "../mocks/MockToken.sol";
 
 contract VoucherNFTStorageTest is Test {
     VoucherNFT public voucherNFT;
-    Treasury public treasury;
     MockToken public testToken;
 
     address public owner;
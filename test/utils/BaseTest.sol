@@ -9,13 +9,16 @@ import {Treasury} from "../../src/treasury/Treasury.sol";
 import {GymManager} from "../../src/gym/GymManager.sol";
 import {StakeManager} from "../../src/staking/StakeManager.sol";
 import {DeGymToken} from "../../src/token/DGYM.sol";
-import {console} from "forge-std/console.sol";
+import {Checkin} from "../../src/dao/Checkin.sol";
 
 /**
  * @title BaseTest
  * @dev Base contract for all test suites
  */
 abstract contract BaseTest is Test {
+    // Fixed clock every suite starts from
+    uint256 internal constant START_TIME = 1000000;
+
     // Common addresses
     address public owner;
     address public user1;
@@ -25,7 +28,6 @@ abstract contract BaseTest is Test {
     // Commonly used tokens
     MockToken public USDT;
     MockToken public testToken;
-    MockToken public DGYM_token;
 
     // Core contracts
     Treasury public treasury;
@@ -33,6 +35,7 @@ abstract contract BaseTest is Test {
     GymManager public gymManager;
     StakeManager public stakeManager;
     VoucherNFT public voucherNFT;
+    Checkin public checkin;
 
     function setUp() public virtual {
         // Setup common addresses
@@ -48,7 +51,7 @@ abstract contract BaseTest is Test {
         vm.label(gymOwner, "GymOwner");
 
         // Initialize with a clean timestamp
-        vm.warp(1000000);
+        vm.warp(START_TIME);
 
         // Deploy tokens
         USDT = new MockToken("Tether", "USDT", 18);
@@ -64,15 +67,6 @@ abstract contract BaseTest is Test {
 
         // Deploy core contracts
         deployCore();
-
-        // Approve DGYM token for stakeManager
-        vm.startPrank(user1);
-        DGYM_token.approve(address(stakeManager), type(uint256).max);
-        vm.stopPrank();
-
-        vm.startPrank(user2);
-        DGYM_token.approve(address(stakeManager), type(uint256).max);
-        vm.stopPrank();
     }
 
     // Deploy core contracts
@@ -84,12 +78,6 @@ abstract contract BaseTest is Test {
         // Use o DeGymToken real
         DeGymToken dgymToken = new DeGymToken(owner);
 
-        // Armazene também como DGYM_token para outros testes
-        DGYM_token = new MockToken("DeGym Token", "DGYM", 18);
-        DGYM_token.mint(owner, 1000000 * 10 ** 18);
-        DGYM_token.mint(user1, 1000 * 10 ** 18);
-        DGYM_token.mint(user2, 1000 * 10 ** 18);
-
         // Use o StakeManager real com o token DGYM
         stakeManager = new StakeManager(address(dgymToken), address(treasury));
 
@@ -115,12 +103,14 @@ abstract contract BaseTest is Test {
         dgymToken.transfer(address(voucherNFT), 1000 * 10 ** 18);
 
         // Aprovar stakeManager para usar os tokens
-        vm.startPrank(address(voucherNFT));
+        vm.prank(address(voucherNFT));
         dgymToken.approve(address(stakeManager), type(uint256).max);
-        vm.stopPrank();
+
+        checkin = new Checkin(address(voucherNFT), address(gymNFT));
 
         // Initialize contracts
         treasury.setGymNFT(address(gymNFT));
+        gymNFT.setCheckinContract(address(checkin));
         treasury.addAcceptedToken(address(testToken));
         treasury.addAcceptedToken(address(USDT));
 
@@ -150,9 +140,8 @@ abstract contract BaseTest is Test {
         address gymOwnerAddress,
         uint8 tier
     ) internal returns (uint256) {
-        vm.startPrank(owner);
+        vm.prank(owner);
         uint256 gymId = gymNFT.mintGymNFT(gymOwnerAddress, tier);
-        vm.stopPrank();
 
         vm.startPrank(gymOwnerAddress);
         gymNFT.addAcceptedToken(gymId, address(testToken));
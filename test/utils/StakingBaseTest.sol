@@ -0,0 +1,59 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import {Test} from "forge-std/Test.sol";
+import {StakeManager} from "../../src/staking/StakeManager.sol";
+import {BondPool} from "../../src/staking/BondPool.sol";
+import {DeGymToken} from "../../src/token/DGYM.sol";
+
+/**
+ * @title StakingBaseTest
+ * @dev Base contract for suites exercising StakeManager and its bond pools
+ */
+abstract contract StakingBaseTest is Test {
+    uint256 private constant ALICE_PRIVATE_KEY = 0xa11ce;
+
+    // Default bond used by tests that only need some stake in place
+    uint256 internal constant BOND_AMOUNT = 1000 * 10 ** 18;
+    uint256 internal constant LOCK_DURATION = 30 days;
+
+    StakeManager public stakeManager;
+    DeGymToken public token;
+    BondPool public aliceBondPool;
+
+    address public alice = vm.addr(ALICE_PRIVATE_KEY);
+    address public owner = address(0x3);
+
+    function setUp() public virtual {
+        vm.startPrank(owner);
+        token = new DeGymToken(owner);
+        stakeManager = new StakeManager(address(token), owner);
+        token.grantRole(token.MINTER_ROLE(), address(stakeManager));
+        token.mint(alice, 1_000_000_000 * 10 ** 18);
+        vm.stopPrank();
+
+        aliceBondPool = deployBondPool(alice);
+    }
+
+    // Helper to deploy a bond pool for a stakeholder
+    function deployBondPool(address stakeholder) internal returns (BondPool) {
+        vm.startPrank(stakeholder);
+        stakeManager.deployBondPool();
+        BondPool bondPool = BondPool(stakeManager.bondPools(stakeholder));
+        token.approve(address(bondPool), type(uint256).max);
+        vm.stopPrank();
+
+        return bondPool;
+    }
+
+    // Helper to bond tokens into a pool on behalf of its stakeholder
+    function bondAs(
+        address stakeholder,
+        BondPool bondPool,
+        uint256 amount,
+        uint256 lockDuration
+    ) internal {
+        vm.prank(stakeholder);
+        bondPool.bond(amount, lockDuration);
+    }
+}